@@ -1,21 +1,23 @@
-import json
+from pathlib import Path
+
+import orjson
 
 json_path = 'src/content/publications.json'
 
-with open(json_path, 'r') as f:
-    pubs = json.load(f)
+pubs = orjson.loads(Path(json_path).read_bytes())
 
 print(f"Original count: {len(pubs)}")
 
 # 1. Update the specific paper
 target_title_frag = "Transcriptional dynamics of CD8+ T-cell exhaustion"
+target_lc = target_title_frag.lower()
 updated_count = 0
-for p in pubs:
-    if target_title_frag.lower() in p['title'].lower():
-        if p['year'] != 2025:
-            print(f"Updating year for: {p['title']}")
-            p['year'] = 2025
-            updated_count += 1
+# Single target paper: stop scanning at the first match
+target = next((p for p in pubs if target_lc in p['title'].lower()), None)
+if target is not None and target['year'] != 2025:
+    print(f"Updating year for: {target['title']}")
+    target['year'] = 2025
+    updated_count += 1
 
 if updated_count == 0:
     print("WARNING: Target paper not found or already 2025.")
@@ -23,11 +25,11 @@ if updated_count == 0:
 # 2. Remove year 0
 clean_pubs = [p for p in pubs if p['year'] != 0]
 
-# Sort again just in case
-clean_pubs.sort(key=lambda x: x['year'], reverse=True)
+# Input is normally already newest-first; only re-sort if the year update broke that
+if any(a['year'] < b['year'] for a, b in zip(clean_pubs, clean_pubs[1:])):
+    clean_pubs.sort(key=lambda x: x['year'], reverse=True)
 
 print(f"Final count: {len(clean_pubs)}")
 print(f"Removed {len(pubs) - len(clean_pubs)} year-0 items.")
 
-with open(json_path, 'w') as f:
-    json.dump(clean_pubs, f, indent=2, ensure_ascii=False)
+Path(json_path).write_bytes(orjson.dumps(clean_pubs, option=orjson.OPT_INDENT_2))
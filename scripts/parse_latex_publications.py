@@ -1,11 +1,66 @@
 import re
-import json
 import io
+import mmap
+import os
+from pathlib import Path
 
-def parse_latex_publications(file_path):
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+import orjson
 
+_RE_COMMENT = re.compile(r'(?<!\\)%.*')
+_RE_ITEM = re.compile(r'\\item')
+_RE_MACRO = re.compile(r'\\(mypub|mybpub|newpub|pub)')
+_RE_YEAR = re.compile(r'\((\d{4})\)')
+_RE_DOI = re.compile(r'doi:\s*(\S+)', re.IGNORECASE)
+_RE_IF = re.compile(r'IF:\s*([\d\.]+)')
+
+# Single-pass cleanup: alternatives are tried left to right, so the most
+# specific dagger/superscript forms must come before the generic ones.
+# Superscripts may still be wrapped in braces (e.g. $^{*}$) since braces are
+# now stripped in the same pass rather than beforehand.
+_RE_CLEAN = re.compile(
+    r'(?P<dag1>\$\^\\dagger\$)'
+    r'|(?P<dag2>\^\\dagger)'
+    r'|(?P<dag3>\\dagger)'
+    r'|(?P<bf>\\bf\s+)'
+    r'|(?P<it>\\it\s+)'
+    r'|(?P<tsl>\\textsl)'
+    r'|(?P<sup1>\$\^\{?(?:\*|\d+)\}?\$)'
+    r'|(?P<sup2>\^\{?(?:\*|\d+)\}?)'
+    r'|(?P<brace>[{}])'
+    r'|(?P<bs>\\)'
+)
+_RE_WS = re.compile(r'\s+')
+
+def extract_brace_args(text, pos, count):
+    # Return up to `count` top-level {...} arguments after `pos`, plus the index after the last one.
+    # Only the brace positions are visited (via str.find); each argument is a single slice.
+    args = []
+    while len(args) < count:
+        start_idx = text.find('{', pos)
+        if start_idx < 0:
+            break
+        depth = 1
+        end_idx = start_idx + 1
+        while depth:
+            next_open = text.find('{', end_idx)
+            next_close = text.find('}', end_idx)
+            if next_close < 0:
+                break
+            if 0 <= next_open < next_close:
+                depth += 1
+                end_idx = next_open + 1
+            else:
+                depth -= 1
+                end_idx = next_close + 1
+        if depth:
+            # Unbalanced braces, give up on this item
+            break
+        args.append(text[start_idx + 1:end_idx - 1].strip())
+        pos = end_idx
+    return args, pos
+
+def parse_latex_publications(file_path, sort_by_year=False):
+    # By default entries keep their LaTeX order; sort_by_year=True returns them newest first
     # Regex to find \item \mypub{Title}{Authors}{Journal}
     # Handling nested braces is tricky with regex, so we might need a somewhat greedy approach or balanced brace parsing.
     # Given the structure, we can try to find `\item` and then the macro.
@@ -13,20 +68,28 @@ def parse_latex_publications(file_path):
     # Let's try to split by \item and then parse each block.
     # The file starts with \begin{enumerate} and ends with \end{enumerate} for the list.
     
-    start_idx = content.find(r'\begin{enumerate}')
-    end_idx = content.find(r'\end{enumerate}')
+    # Map the file and only decode the enumerate block, not the whole document
+    start_idx = end_idx = -1
+    with open(file_path, 'rb') as f:
+        # mmap refuses empty files
+        if os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                start_idx = mm.find(rb'\begin{enumerate}')
+                # Only scan past the opening marker for the closing one
+                if start_idx != -1:
+                    end_idx = mm.find(rb'\end{enumerate}', start_idx)
+                if start_idx != -1 and end_idx != -1:
+                    items_block = mm[start_idx:end_idx].decode('utf-8')
     
     if start_idx == -1 or end_idx == -1:
         print("Could not find enumerate block")
         return []
-
-    items_block = content[start_idx:end_idx]
     
     # Remove comments: % that is not escaped
-    items_block = re.sub(r'(?<!\\)%.*', '', items_block)
+    items_block = _RE_COMMENT.sub('', items_block)
     
     # Split by \item, but ignore the first empty part
-    raw_items = re.split(r'\\item', items_block)[1:]
+    raw_items = _RE_ITEM.split(items_block)[1:]
     
         # Check for section markers in the *previous* item's tail or this item's start?
         # Actually simplest is to check if the raw_item text CONTAINS the marker.
@@ -69,19 +132,12 @@ def parse_latex_publications(file_path):
 
         # We look for the pattern: \macro {Arg1} {Arg2} {Arg3}
         
-        # Simple stack-based brace parser to extract 3 arguments
-        args = []
-        depth = 0
-        current_arg = []
-        in_arg = False
-        arg_count = 0
-        
         # Find start of first brace
         scan_idx = 0
         
         # Check macro name to handle parameter order
         is_newpub = False
-        macro_match = re.search(r'\\(mypub|mybpub|newpub|pub)', raw_item)
+        macro_match = _RE_MACRO.search(raw_item)
         if macro_match:
             macro_name = macro_match.group(1)
             if macro_name == 'newpub':
@@ -92,28 +148,8 @@ def parse_latex_publications(file_path):
             # Should have found a macro, but if not, assumes standard start
             pass
             
-        while scan_idx < len(raw_item) and arg_count < 3:
-            char = raw_item[scan_idx]
-            
-            if char == '{':
-                if depth == 0:
-                    in_arg = True
-                else:
-                    current_arg.append(char)
-                depth += 1
-            elif char == '}':
-                depth -= 1
-                if depth == 0:
-                    in_arg = False
-                    args.append("".join(current_arg).strip())
-                    current_arg = []
-                    arg_count += 1
-                else:
-                    current_arg.append(char)
-            elif in_arg:
-                current_arg.append(char)
-            
-            scan_idx += 1
+        # Brace parser to extract 3 arguments
+        args, scan_idx = extract_brace_args(raw_item, scan_idx, 3)
             
         if len(args) < 3:
             print(f"Skipping malformed item: {raw_item[:50]}...")
@@ -132,8 +168,7 @@ def parse_latex_publications(file_path):
             
         journal_tex = args[2]
         
-        # Extract extra info like IF and DOI from the rest of the string
-        rest_of_item = raw_item[scan_idx:]
+        # Extra info like IF and DOI is searched from scan_idx onward, without slicing the item
         
         # Parse Title
         title = clean_tex(title_tex)
@@ -145,12 +180,12 @@ def parse_latex_publications(file_path):
         journal_info = clean_tex(journal_tex)
         year = 0
         # Try to find year in (YYYY) or bold YYYY or just YYYY
-        year_match = re.search(r'\((\d{4})\)', journal_info)
+        year_match = _RE_YEAR.search(journal_info)
         if year_match:
             year = int(year_match.group(1))
         else:
-            # Fallback check in rest_of_item if extracted from journal string failed
-             year_match = re.search(r'\((\d{4})\)', rest_of_item)
+            # Fallback check in the rest of the item if extracted from journal string failed
+             year_match = _RE_YEAR.search(raw_item, scan_idx)
              if year_match:
                  year = int(year_match.group(1))
 
@@ -160,15 +195,15 @@ def parse_latex_publications(file_path):
                 year = 2025 # Assumption for "accepted" current papers based on context
         
         # Parse DOI from comments or text
-        # Look for doi: ... in the rest_of_item
+        # Look for doi: ... in the rest of the item
         doi = ""
-        doi_match = re.search(r'doi:\s*(\S+)', rest_of_item, re.IGNORECASE)
+        doi_match = _RE_DOI.search(raw_item, scan_idx)
         if doi_match:
             doi = doi_match.group(1).rstrip('}') # occasional cleanup
             
         # Parse Impact Factor
         note = ""
-        if_match = re.search(r'IF:\s*([\d\.]+)', rest_of_item)
+        if_match = _RE_IF.search(raw_item, scan_idx)
         if if_match:
             note = f"IF: {if_match.group(1)}"
             
@@ -185,34 +220,32 @@ def parse_latex_publications(file_path):
         # Update type for next item
         current_type = next_type
         
+    if sort_by_year:
+        publications.sort(key=lambda x: x['year'], reverse=True)
+        
     return publications
 
+def _clean_repl(m):
+    # Daggers become the symbol; every other command/markup is dropped
+    return '†' if m.lastgroup.startswith('dag') else ''
+
 def clean_tex(text):
-    # Remove tex commands
-    text = re.sub(r'\\bf\s+', '', text)
-    text = re.sub(r'\\it\s+', '', text)
-    text = re.sub(r'\\textsl', '', text)
-    # Order matters! Match most specific first.
-    text = re.sub(r'\$\^\\dagger\$', '†', text) # Replace $^\dagger$ with symbol
-    text = re.sub(r'\^\\dagger', '†', text) # Replace ^\dagger with symbol
-    text = re.sub(r'\\dagger', '†', text) # Replace leftover \dagger
-    text = re.sub(r'[\{\}]', '', text) # Remove braces
-    text = re.sub(r'\$\^(\*|\d+)\$', '', text) # Remove math superscripts like $^*$
-    text = re.sub(r'\^(\*|\d+)', '', text) # Remove superscripts
-    text = re.sub(r'\\', '', text) # Remove backslashes
-    text = re.sub(r'\s+', ' ', text) # Normalize spaces
+    # Fast path: every _RE_CLEAN alternative starts with one of these chars
+    if not any(c in text for c in '\\{}$^'):
+        return ' '.join(text.split())
+    # Remove tex commands, braces and superscripts in one pass
+    text = _RE_CLEAN.sub(_clean_repl, text)
+    text = _RE_WS.sub(' ', text) # Normalize spaces
     return text.strip()
 
 if __name__ == "__main__":
     latex_file = 'pub-260201.tex'
     json_output = 'src/content/publications.json'
     
-    pubs = parse_latex_publications(latex_file)
-    
     # Do not sort, preserve order from LaTeX
-    # pubs.sort(key=lambda x: x['year'], reverse=True)
+    pubs = parse_latex_publications(latex_file, sort_by_year=False)
     
     print(f"Parsed {len(pubs)} publications.")
     
-    with open(json_output, 'w', encoding='utf-8') as f:
-        json.dump(pubs, f, indent=2, ensure_ascii=False)
+    # orjson always emits UTF-8, matching ensure_ascii=False
+    Path(json_output).write_bytes(orjson.dumps(pubs, option=orjson.OPT_INDENT_2))
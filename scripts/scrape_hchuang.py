@@ -1,8 +1,11 @@
-import json
 import re
 import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
 
+import orjson
 import requests
 from bs4 import BeautifulSoup
 
@@ -11,17 +14,33 @@ ROOT = Path(__file__).resolve().parents[1]
 CONTENT_DIR = ROOT / "src" / "content"
 CONTENT_DIR.mkdir(parents=True, exist_ok=True)
 
+# Shared connection pool so all pages reuse the same keep-alive connection
+SESSION = requests.Session()
 
+_RE_DATE = re.compile(r"(\d{4}\.\d{2})\s+(.*)")
+# Name is everything before the first '('; start year is the first "NN-" after it
+_MEMBER_RE = re.compile(r"^(?P<name>[^(]*)(?:\(.*?(?P<yy>\d{2})-)?", re.DOTALL)
+_RE_LEAD_NUM = re.compile(r"^\d+\.")
+_RE_LEAD_NUM_WS = re.compile(r"^\d+\.\s*")
+_RE_PAREN_YEAR = re.compile(r"\((\d{4})\)")
+_RE_BARE_YEAR = re.compile(r"\b(19|20)\d{2}\b")
+_RE_CURLY_QUOTED = re.compile(r"“([^”]+)”")
+_RE_QUOTED = re.compile(r"\"([^\"]+)\"")
+_HEADER_RE = re.compile(r"Selected (Journal Papers|Conference Proceedings)")
+
+
+@lru_cache(maxsize=32)
 def fetch(url: str) -> BeautifulSoup:
+    """Fetch and parse a page (cached per URL; do not mutate the result)."""
     try:
         print(f"Fetching {url}...")
-        resp = requests.get(url, timeout=30)
+        resp = SESSION.get(url, timeout=30)
         resp.raise_for_status()
-        resp.encoding = 'utf-8'
-        return BeautifulSoup(resp.text, "html.parser")
+        # Hand raw bytes to lxml (C parser) instead of decoding in Python first
+        return BeautifulSoup(resp.content, "lxml", from_encoding="utf-8")
     except Exception as e:
         print(f"Error fetching {url}: {e}")
-        return BeautifulSoup("", "html.parser")
+        return BeautifulSoup("", "lxml")
 
 
 def clean_text(text: str) -> str:
@@ -52,7 +71,7 @@ def scrape_news() -> list[dict]:
             for li in ul.find_all("li"):
                 text = clean_text(li.get_text())
                 # Format: YYYY.MM Content
-                match = re.search(r"(\d{4}\.\d{2})\s+(.*)", text) # Use search, not match, to be safer
+                match = _RE_DATE.search(text) # Use search, not match, to be safer
                 if match:
                     date_str = match.group(1).replace(".", "-") + "-01"
                     content = match.group(2)
@@ -85,7 +104,12 @@ def scrape_people() -> dict:
 
     # --- PI ---
     pi_url = f"{BASE_URL}/doku.php?id=PI:Hsuan-Cheng%20Huang"
-    soup = fetch(pi_url)
+    mem_url = f"{BASE_URL}/doku.php?id=members:start"
+    # Fetch both pages concurrently
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        f_pi = ex.submit(fetch, pi_url)
+        f_mem = ex.submit(fetch, mem_url)
+        soup = f_pi.result()
     # This page structure is simple headers.
     # We'll just hardcode the PI since scraping this free-text is error-prone and static.
     # But let's try to grab the title/email if possible or just use the hardcoded one from prompt as fallback
@@ -102,8 +126,7 @@ def scrape_people() -> dict:
 
 
     # --- Members ---
-    mem_url = f"{BASE_URL}/doku.php?id=members:start"
-    soup = fetch(mem_url)
+    soup = f_mem.result()
     
     # Sections: Research assistant, PhD students, MS students, Alumni
     # DokuWiki headers often have IDs: research_assistant, phd_students, ms_students, alumni
@@ -120,9 +143,9 @@ def scrape_people() -> dict:
         if not header:
             continue
             
-        curr = header.next_sibling
-        while curr:
-            if curr.name and curr.name.startswith("h1"): # DokuWiki h1? Actually the chunk showed h1.
+        # find_next_siblings() yields tags only, skipping whitespace strings
+        for curr in header.find_next_siblings():
+            if curr.name.startswith("h1"): # DokuWiki h1? Actually the chunk showed h1.
                 break
                 
             # If we hit another header level closer to h1/h2? 
@@ -151,20 +174,18 @@ def scrape_people() -> dict:
                     # Example: 陳韻茹 Yun-Ru Chen (18- , 09- 18 BMI phd, 08-09 BMI m1)
                     # Example: 杜岳華 Yueh-Hua Tu (19- TIGP, w/ Prof. Juan; 14-16 BMI ms)
                     
-                    # Regex to find name and parens
-                    # We want the part BEFORE the first '(' as name
-                    parts = line.split('(', 1)
-                    name_part = parts[0].strip()
-                    desc_part = "(" + parts[1] if len(parts) > 1 else ""
+                    # One regex pass for the name (before the first '(') and start year
+                    m = _MEMBER_RE.match(line)
+                    name_part = m.group("name").strip()
                     
                     if not name_part or len(name_part) < 2: continue
                     
                     # Attempt to extract start year
                     start_year = None
-                    yr_match = re.search(r"(\d{2})[-]", desc_part)
-                    if yr_match:
+                    yy = m.group("yy")
+                    if yy:
                         # assume 20xx
-                        start_year = 2000 + int(yr_match.group(1))
+                        start_year = 2000 + int(yy)
                         # minimal logic for 90s?
                         if start_year > 2030: start_year -= 100 
                     
@@ -181,8 +202,6 @@ def scrape_people() -> dict:
                         data["alumni"].append(entry)
                     else:
                         data["members"].append(entry)
-                        
-            curr = curr.next_sibling
 
     return data
 
@@ -197,21 +216,19 @@ def scrape_publications() -> list[dict]:
     # ID: selected_journal_papers_期刊論文 (DokuWiki auto-generates IDs from text)
     # We'll just look for the header text contained in H2
     
-    target_sections = ["Selected Journal Papers", "Selected Conference Proceedings"]
-    
     for h2 in soup.find_all(["h2", "h3"]):
-        header_text = h2.get_text()
-        if any(t in header_text for t in target_sections):
-            venue_type = "Journal" if "Journal" in header_text else "Conference"
+        # One scan matches either target section and tells us which it is
+        header_match = _HEADER_RE.search(h2.get_text())
+        if header_match:
+            venue_type = "Journal" if header_match.group(1).startswith("Journal") else "Conference"
             
             # Find next content container
-            curr = h2.next_sibling
-            while curr:
-                if curr.name and curr.name.startswith("h"):
+            for curr in h2.find_next_siblings():
+                if curr.name.startswith("h"):
                     break 
                 
                 # Search targets: list items or paragraphs if no list
-                items_nodes = []
+                items_nodes = ()
                 
                 if curr.name in ["ol", "ul"]:
                     items_nodes = curr.find_all("li")
@@ -219,8 +236,8 @@ def scrape_publications() -> list[dict]:
                     # Check for lists first
                     lists = curr.find_all(["ol", "ul"])
                     if lists:
-                        for l in lists:
-                            items_nodes.extend(l.find_all("li"))
+                        # Walk each list's items lazily instead of concatenating them
+                        items_nodes = chain.from_iterable(l.find_all("li") for l in lists)
                     else:
                         # Fallback to <p> tags if no list
                         items_nodes = curr.find_all("p")
@@ -230,22 +247,22 @@ def scrape_publications() -> list[dict]:
                     
                     # Filter: Must start with number if from p tag (loose check)
                     # "1.Authors..."
-                    if not re.match(r"^\d+\.", text):
+                    if not _RE_LEAD_NUM.match(text):
                         continue
                         
                     # Remove leading number "1. "
-                    text = re.sub(r"^\d+\.\s*", "", text)
+                    text = _RE_LEAD_NUM_WS.sub("", text)
 
                     # Format: Authors. "Title." Venue (Year).
                     # ... (same parsing regex) ...
                     
                     # 1. Year
                     year = 0
-                    y_match = re.search(r"\((\d{4})\)", text)
+                    y_match = _RE_PAREN_YEAR.search(text)
                     if y_match:
                         year = int(y_match.group(1))
                     else:
-                        y_match2 = re.search(r"\b(19|20)\d{2}\b", text)
+                        y_match2 = _RE_BARE_YEAR.search(text)
                         if y_match2:
                             year = int(y_match2.group(0))
                     
@@ -258,7 +275,7 @@ def scrape_publications() -> list[dict]:
                     # 3. Title
                     # Heuristic: Authors are usually first. Title is often quoted.
                     title = text
-                    t_match = re.search(r"“([^”]+)”", text) or re.search(r"\"([^\"]+)\"", text)
+                    t_match = _RE_CURLY_QUOTED.search(text) or _RE_QUOTED.search(text)
                     if t_match:
                         title = t_match.group(1)
                     
@@ -275,27 +292,31 @@ def scrape_publications() -> list[dict]:
                         "note": ""
                     })
                 
-                curr = curr.next_sibling
-                
     return items
 
 
 def main():
     print("Starting scrape...")
-    news = scrape_news()
-    people = scrape_people()
-    pubs = scrape_publications()
+    # Pages are independent, so scrape them concurrently
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        f_news = ex.submit(scrape_news)
+        f_people = ex.submit(scrape_people)
+        f_pubs = ex.submit(scrape_publications)
+        news, people, pubs = f_news.result(), f_people.result(), f_pubs.result()
 
     print(f"Found {len(news)} news items")
     print(f"Found {len(people.get('pi', []))} PI, {len(people.get('members', []))} members")
     print(f"Found {len(pubs)} publications")
 
-    if news:
-        (CONTENT_DIR / "news.json").write_text(json.dumps(news, ensure_ascii=False, indent=2), encoding="utf-8")
-    if people["pi"] or people["members"]:
-        (CONTENT_DIR / "people.json").write_text(json.dumps(people, ensure_ascii=False, indent=2), encoding="utf-8")
-    if pubs:
-        (CONTENT_DIR / "publications.json").write_text(json.dumps(pubs, ensure_ascii=False, indent=2), encoding="utf-8")
+    # Only overwrite a content file when its scrape produced something
+    outputs = (
+        ("news", news, bool(news)),
+        ("people", people, bool(people["pi"] or people["members"])),
+        ("publications", pubs, bool(pubs)),
+    )
+    for name, obj, has_data in outputs:
+        if has_data:
+            (CONTENT_DIR / f"{name}.json").write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
 
     print("Scrape complete. Checked/Wrote news.json, people.json, publications.json to src/content")
 